@@ -1,13 +1,15 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
+import hashlib
+import io
 import json
 import os
 from pathlib import Path
-from fpdf import FPDF
 import random
+import tempfile
+import threading
 
 # Page config
 st.set_page_config(
@@ -16,103 +18,64 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize session state
-if 'workouts' not in st.session_state:
-    st.session_state.workouts = []
-if 'goals' not in st.session_state:
-    st.session_state.goals = []
+# Workouts are persisted between sessions as a Feather (Arrow IPC) file
+WORKOUTS_FILE = Path(__file__).parent / "workouts.arrow"
 
 # Updated Styling
-st.markdown("""
-    <style>
-    .main {
-        padding: 2rem;
-    }
-    .stButton>button {
-        width: 100%;
-        height: 3rem;
-        font-size: 1.2rem;
-        background-color: #1E88E5 !important;
-        color: white;
-        border: none !important;
-    }
-    .stButton>button:hover {
-        background-color: #1E88E5 !important;
-        border: none !important;
-    }
-    .stButton>button:active {
-        background-color: #1E88E5 !important;
-        border: none !important;
-    }
-    .workout-card {
-        padding: 1.5rem;
-        background-color: white;
-        border: 2px solid #e6e6e6;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .metric-card {
-        text-align: center;
-        padding: 1.5rem;
-        background-color: white;
-        border: 2px solid #1E88E5;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .goal-card {
-        background-color: white;
-        border: 2px solid #1E88E5;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .tip-box {
-        background-color: white;
-        border-left: 5px solid #1E88E5;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .level-box {
-        background-color: white;
-        border: 2px solid #1E88E5;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-    }
-    h1, h2, h3, h4 {
-        color: #1565C0;
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _load_css():
+    """Read the dashboard stylesheet once per server process"""
+    return (Path(__file__).parent / "styles.css").read_text()
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # Constants
 FITNESS_TIPS = {
-    "Beginner": [
+    "Beginner": (
         "Start with 10 minutes of walking daily",
         "Stay hydrated - drink water before, during, and after exercise",
         "Focus on proper form rather than speed",
         "Get at least 7-8 hours of sleep",
         "Start with bodyweight exercises before using weights"
-    ],
-    "Intermediate": [
+    ),
+    "Intermediate": (
         "Mix cardio with strength training",
         "Try HIIT workouts for better results",
         "Include rest days in your routine",
         "Track your protein intake",
         "Try new exercises to challenge yourself"
-    ],
-    "Advanced": [
+    ),
+    "Advanced": (
         "Focus on progressive overload",
         "Consider split training routines",
         "Monitor your heart rate zones",
         "Plan deload weeks",
         "Include mobility work in your routine"
-    ]
+    )
 }
 
-MOTIVATIONAL_QUOTES = [
+WORKOUT_TYPES = ["Running", "Cycling", "Strength Training", "Yoga", "Swimming", "HIIT", "Other"]
+
+WORKOUT_DTYPES = {
+    'date': 'datetime64[ns]',
+    'type': pd.CategoricalDtype(categories=WORKOUT_TYPES),
+    'duration': 'int32',
+    'calories': 'int32',
+    'distance': 'float32',
+    'heart_rate': 'int32',
+    'notes': 'object'
+}
+
+RECENT_WORKOUTS_LIMIT = 50
+
+PROGRESS_CHART_MAX_POINTS = 1000
+
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+
+# Per-function bound on cached payloads; each save produces a new workouts key
+CACHE_MAX_ENTRIES = 32
+
+MOTIVATIONAL_QUOTES = (
     "💪 Every rep counts!",
     "🌟 You're stronger than you think!",
     "🎯 Small progress is still progress!",
@@ -121,128 +84,226 @@ MOTIVATIONAL_QUOTES = [
     "✨ You're doing amazing!",
     "💫 Consistency beats perfection!",
     "🌈 Every workout makes you stronger!"
-]
+)
+
+def _latin1(text):
+    """Replace characters the core PDF fonts cannot encode"""
+    return text.encode('latin-1', errors='replace').decode('latin-1')
 
 # Updated PDF creation function
-def create_pdf_report(workouts):
+def create_pdf_report(df):
     """Create PDF report from workout data"""
+    from fpdf import FPDF, XPos, YPos
+    
+    pdf = FPDF()
+    pdf.add_page()
+    
+    # Title
+    pdf.set_font('Helvetica', 'B', 16)
+    pdf.cell(0, 10, 'Fitness Tracker Report', 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='C')
+    pdf.ln(10)
+    
+    # Summary
+    metrics = calculate_metrics(df)
+    
+    pdf.set_font('Helvetica', 'B', 12)
+    pdf.cell(0, 10, 'Summary', 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+    pdf.set_font('Helvetica', '', 12)
+    pdf.cell(0, 10, f"Total Workouts: {metrics['total_workouts']}", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+    pdf.cell(0, 10, f"Total Duration: {metrics['total_duration']} minutes", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+    pdf.cell(0, 10, f"Total Calories: {metrics['total_calories']} kcal", 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+    pdf.ln(10)
+    
+    # Workout List
+    pdf.set_font('Helvetica', 'B', 12)
+    pdf.cell(0, 10, 'Workout History', 0, new_x=XPos.LMARGIN, new_y=YPos.NEXT, align='L')
+    
+    # Convert all values to latin-1 safe strings up front
+    rows = [
+        [
+            workout.date.strftime("%Y-%m-%d"),
+            workout.type,  # One of WORKOUT_TYPES, already ASCII and short
+            str(workout.duration),
+            str(workout.calories),
+            _latin1(workout.notes[:40])  # Fits the column without wrapping
+        ]
+        for workout in df.itertuples(index=False)
+    ]
+    
+    # Table
+    pdf.set_font('Helvetica', '', 10)
+    with pdf.table(col_widths=(30, 30, 30, 30, 70)) as table:
+        table.row(['Date', 'Type', 'Duration', 'Calories', 'Notes'])
+        for row in rows:
+            table.row(row)
+    
+    return bytes(pdf.output())
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _pdf_bytes(workouts_key, _df):
+    """Build the PDF report once per set of workouts (errors raise, so they are not cached)"""
+    return create_pdf_report(_df)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _csv_bytes(workouts_key, _df):
+    """Encode the workouts as CSV once per set of workouts"""
+    buf = io.BytesIO()
+    _df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _txt_bytes(workouts_key, _df):
+    """Encode the workouts as tab-separated text once per set of workouts"""
+    buf = io.BytesIO()
+    _df.to_csv(buf, sep='\t', index=False, encoding='utf-8')
+    return buf.getvalue()
+
+# Helper functions
+def _workouts_key(data):
+    """Derive the workouts cache key from the serialized workouts file"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+@st.cache_resource
+def _workouts_file_lock():
+    """Lock shared by all sessions of this server process around the workouts file"""
+    return threading.Lock()
+
+def _read_workouts_file():
+    """Load the typed workouts and their cache key from the workouts file"""
+    data = WORKOUTS_FILE.read_bytes()
+    df = pd.read_feather(io.BytesIO(data)).astype(WORKOUT_DTYPES)
+    return df, _workouts_key(data)
+
+def _write_workouts_file(df):
+    """Atomically replace the workouts file and return the new cache key"""
+    buf = io.BytesIO()
+    df.to_feather(buf)
+    data = buf.getvalue()
+    
+    # Write next to the target so os.replace never crosses filesystems
+    with tempfile.NamedTemporaryFile(dir=WORKOUTS_FILE.parent, prefix=WORKOUTS_FILE.name, suffix='.tmp', delete=False) as tmp:
+        tmp.write(data)
+        tmp.flush()
+        os.fsync(tmp.fileno())
     try:
-        pdf = FPDF()
-        pdf.add_page()
-        
-        # Title
-        pdf.set_font('Arial', 'B', 16)
-        pdf.cell(0, 10, 'Fitness Tracker Report', 0, 1, 'C')
-        pdf.ln(10)
-        
-        # Summary
-        metrics = calculate_metrics(workouts)
-        
-        pdf.set_font('Arial', 'B', 12)
-        pdf.cell(0, 10, 'Summary', 0, 1, 'L')
-        pdf.set_font('Arial', '', 12)
-        pdf.cell(0, 10, f"Total Workouts: {metrics['total_workouts']}", 0, 1, 'L')
-        pdf.cell(0, 10, f"Total Duration: {metrics['total_duration']} minutes", 0, 1, 'L')
-        pdf.cell(0, 10, f"Total Calories: {metrics['total_calories']} kcal", 0, 1, 'L')
-        pdf.ln(10)
-        
-        # Workout List
-        pdf.set_font('Arial', 'B', 12)
-        pdf.cell(0, 10, 'Workout History', 0, 1, 'L')
-        
-        # Table header
-        pdf.set_font('Arial', 'B', 10)
-        pdf.cell(30, 10, 'Date', 1)
-        pdf.cell(30, 10, 'Type', 1)
-        pdf.cell(30, 10, 'Duration', 1)
-        pdf.cell(30, 10, 'Calories', 1)
-        pdf.ln()
-        
-        # Table content
-        pdf.set_font('Arial', '', 10)
-        for workout in workouts:
-            # Convert all values to ASCII-safe strings
-            date = str(workout['date'])
-            workout_type = workout['type'][:20]  # Limit length to avoid overflow
-            duration = str(workout['duration'])
-            calories = str(workout['calories'])
-            
-            try:
-                pdf.cell(30, 10, date, 1)
-                pdf.cell(30, 10, workout_type, 1)
-                pdf.cell(30, 10, duration, 1)
-                pdf.cell(30, 10, calories, 1)
-                pdf.ln()
-            except Exception:
-                continue
-        
-        return pdf.output(dest='S').encode('latin-1', errors='replace')
-    except Exception as e:
-        st.error(f"Error creating PDF: {str(e)}")
-        return None
+        os.replace(tmp.name, WORKOUTS_FILE)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+    return _workouts_key(data)
+
+def _workouts_to_df(workouts):
+    """Build a typed workouts DataFrame from workout records"""
+    return pd.DataFrame(workouts, columns=list(WORKOUT_DTYPES)).astype(WORKOUT_DTYPES)
 
-# Helper functions (unchanged)
-def generate_exercise_tips(workouts):
+def _weekly_cutoff():
+    """Return the first day counted towards this week's workouts"""
+    return np.datetime64(datetime.now().date()) - np.timedelta64(7, 'D')
+
+def generate_exercise_tips(df):
     """Generate personalized exercise tips based on workout history"""
-    if not workouts:
+    if df.empty:
         return ["Start your fitness journey by logging your first workout!"]
     
-    df = pd.DataFrame(workouts)
     tips = []
     
-    df['date'] = pd.to_datetime(df['date'])
-    weekly_workouts = len(df[df['date'] >= (datetime.now() - timedelta(days=7))])
+    weekly_workouts = int((df['date'].values >= _weekly_cutoff()).sum())
+    avg_duration = df['duration'].to_numpy().mean()
+    avg_calories = df['calories'].to_numpy().mean()
+    type_count = df['type'].nunique()
+    
     if weekly_workouts < 3:
         tips.append("Try to exercise at least 3 times per week for better results")
     
-    avg_duration = df['duration'].mean()
     if avg_duration < 30:
         tips.append("Aim for at least 30 minutes per workout session")
     
-    workout_types = df['type'].unique()
-    if len(workout_types) < 3:
+    if type_count < 3:
         tips.append("Mix up your routine with different types of exercises")
     
-    avg_calories = df['calories'].mean()
     if avg_calories < 200:
         tips.append("Consider increasing workout intensity to burn more calories")
     
     return tips
 
+def _coerce_workout(workout_data):
+    """Cast workout fields to their stored Python types"""
+    workout_data['date'] = pd.Timestamp(workout_data['date'])
+    workout_data['duration'] = int(workout_data['duration'])
+    workout_data['calories'] = int(workout_data['calories'])
+    workout_data['distance'] = float(workout_data['distance'])
+    workout_data['heart_rate'] = int(workout_data['heart_rate'])
+    workout_data['notes'] = str(workout_data.get('notes') or '')
+    return workout_data
+
 def save_workout(workout_data):
-    """Save workout to session state"""
-    st.session_state.workouts.append(workout_data)
+    """Append a workout to the workouts file and refresh session state from it"""
+    row = _workouts_to_df([_coerce_workout(workout_data)])
+    
+    # Re-read under the lock so workouts saved by other sessions are kept
+    with _workouts_file_lock():
+        try:
+            df, _ = _read_workouts_file()
+        except FileNotFoundError:
+            df = row
+        else:
+            df = pd.concat([df, row], ignore_index=True)
+        workouts_key = _write_workouts_file(df)
+    
+    st.session_state.workouts_df = df
+    st.session_state.workouts_key = workouts_key
 
-def create_progress_chart(data, metric='duration'):
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def create_progress_chart(workouts_key, _df, metric='duration'):
     """Create line chart for progress visualization"""
-    df = pd.DataFrame(data)
-    fig = px.line(
-        df, 
-        x='date', 
-        y=metric,
-        title=f'{metric.title()} Over Time'
-    )
-    fig.update_layout(
-        xaxis_title="Date",
-        yaxis_title=metric.title(),
-        showlegend=True
+    import plotly.graph_objects as go
+    
+    # Plot in date order; backdated entries would otherwise zig-zag the line
+    x = _df['date'].to_numpy()
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], _df[metric].to_numpy()[order]
+    if len(y) > PROGRESS_CHART_MAX_POINTS:
+        # LTTB keeps the visual shape of long histories
+        from tsdownsample import LTTBDownsampler
+        
+        keep = LTTBDownsampler().downsample(x.view('int64'), y, n_out=PROGRESS_CHART_MAX_POINTS)
+        x, y = x[keep], y[keep]
+    
+    fig = go.Figure(
+        data=[go.Scattergl(x=x, y=y, mode='lines')],
+        layout=go.Layout(
+            title=f'{metric.title()} Over Time',
+            xaxis_title="Date",
+            yaxis_title=metric.title(),
+            hovermode=False
+        )
     )
     return fig
 
-def create_workout_distribution(data):
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def create_workout_distribution(workouts_key, _df):
     """Create pie chart for workout type distribution"""
-    df = pd.DataFrame(data)
-    workout_counts = df['type'].value_counts()
-    fig = px.pie(
-        values=workout_counts.values,
-        names=workout_counts.index,
-        title="Workout Type Distribution"
+    import plotly.graph_objects as go
+    
+    types = _df['type'].cat
+    codes = types.codes.to_numpy()
+    # Missing types are coded -1, which bincount rejects
+    workout_counts = np.bincount(codes[codes >= 0], minlength=len(types.categories))
+    logged = workout_counts > 0
+    fig = go.Figure(
+        data=[go.Pie(
+            labels=types.categories.to_numpy()[logged],
+            values=workout_counts[logged],
+            textposition='inside',
+            hoverinfo='skip'
+        )],
+        layout=go.Layout(title="Workout Type Distribution")
     )
     return fig
 
-def calculate_metrics(workouts):
+def calculate_metrics(df):
     """Calculate summary metrics"""
-    if not workouts:
+    if df.empty:
         return {
             'total_workouts': 0,
             'total_duration': 0,
@@ -251,33 +312,99 @@ def calculate_metrics(workouts):
             'weekly_workouts': 0
         }
     
-    df = pd.DataFrame(workouts)
-    weekly_df = df[df['date'] >= (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")]
+    total_workouts = len(df)
+    total_duration = int(df['duration'].to_numpy().sum())
     
     return {
-        'total_workouts': len(workouts),
-        'total_duration': df['duration'].sum(),
-        'total_calories': df['calories'].sum(),
-        'avg_duration': round(df['duration'].mean(), 1),
-        'weekly_workouts': len(weekly_df)
+        'total_workouts': total_workouts,
+        'total_duration': total_duration,
+        'total_calories': int(df['calories'].to_numpy().sum()),
+        'avg_duration': round(total_duration / total_workouts, 1),
+        'weekly_workouts': int((df['date'].values >= _weekly_cutoff()).sum())
     }
 
-def get_fitness_level(workouts):
+def get_fitness_level(df):
     """Determine user's fitness level based on workout history"""
-    if not workouts:
+    total_workouts = len(df)
+    if total_workouts < 10:
         return "Beginner"
     
-    df = pd.DataFrame(workouts)
-    total_workouts = len(df)
-    avg_duration = df['duration'].mean()
+    avg_duration = df['duration'].to_numpy().mean()
     
-    if total_workouts < 10 or avg_duration < 20:
+    if avg_duration < 20:
         return "Beginner"
     elif total_workouts < 30 or avg_duration < 45:
         return "Intermediate"
     else:
         return "Advanced"
 
+def get_daily_tip(fitness_level):
+    """Pick this session's tip and quote of the day for a fitness level"""
+    pick = datetime.now().date().toordinal() + st.session_state.tip_seed
+    tips = FITNESS_TIPS[fitness_level]
+    return tips[pick % len(tips)], MOTIVATIONAL_QUOTES[pick % len(MOTIVATIONAL_QUOTES)]
+
+def _progress_section(workouts_key, df):
+    """Render the progress charts"""
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(
+            create_progress_chart(workouts_key, df, 'duration'),
+            use_container_width=True,
+            config=STATIC_CHART_CONFIG
+        )
+    with col2:
+        st.plotly_chart(
+            create_workout_distribution(workouts_key, df),
+            use_container_width=True,
+            config=STATIC_CHART_CONFIG
+        )
+
+def _tips_section(df):
+    """Render the personalized exercise tips"""
+    st.subheader("💡 Personalized Tips")
+    tips = generate_exercise_tips(df)
+    if tips:
+        tips_html = "".join(f"""
+            <div class="tip-box">
+                <p style='color: #1a1a1a; margin: 0;'>💡 {tip}</p>
+            </div>
+        """ for tip in tips)
+        st.markdown(tips_html, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def _recent_table(workouts_key, _df):
+    """Convert the most recent workouts to an Arrow table once per set of workouts"""
+    import pyarrow as pa
+    
+    return pa.Table.from_pandas(_df.iloc[::-1].head(RECENT_WORKOUTS_LIMIT), preserve_index=False)
+
+def _recent_section(workouts_key, df):
+    """Render the recent workouts table"""
+    st.subheader("Recent Workouts")
+    st.dataframe(
+        _recent_table(workouts_key, df),
+        use_container_width=True,
+        hide_index=True,
+        column_config={'date': st.column_config.DateColumn()}
+    )
+
+# Initialize session state
+if 'workouts_df' not in st.session_state:
+    try:
+        st.session_state.workouts_df, st.session_state.workouts_key = _read_workouts_file()
+    except FileNotFoundError:
+        st.session_state.workouts_df = pd.DataFrame()
+        st.session_state.workouts_key = ''
+    except Exception as e:
+        st.session_state.workouts_df = pd.DataFrame()
+        st.session_state.workouts_key = ''
+        st.warning(f"Could not load saved workouts: {str(e)}")
+if 'goals' not in st.session_state:
+    st.session_state.goals = []
+if 'tip_seed' not in st.session_state:
+    st.session_state.tip_seed = random.randrange(1 << 30)
+
 def main():
     st.title("💪 Fitness Tracker Dashboard")
     st.markdown("Track, Visualize, and Improve Your Fitness Journey")
@@ -300,10 +427,7 @@ def main():
             
             with col1:
                 date = st.date_input("Date", datetime.now())
-                workout_type = st.selectbox(
-                    "Workout Type",
-                    ["Running", "Cycling", "Strength Training", "Yoga", "Swimming", "HIIT", "Other"]
-                )
+                workout_type = st.selectbox("Workout Type", WORKOUT_TYPES)
                 
             with col2:
                 duration = st.number_input("Duration (minutes)", min_value=1, value=30)
@@ -323,7 +447,7 @@ def main():
             
             if st.button("Save Workout", use_container_width=True):
                 workout = {
-                    'date': date.strftime("%Y-%m-%d"),
+                    'date': date,
                     'type': workout_type,
                     'duration': duration,
                     'calories': calories,
@@ -331,14 +455,17 @@ def main():
                     'heart_rate': heart_rate,
                     'notes': notes
                 }
-                save_workout(workout)
-                
-                st.success("Workout logged successfully! 🎉")
-                st.markdown(f"### {random.choice(MOTIVATIONAL_QUOTES)}")
-                
-                fitness_level = get_fitness_level(st.session_state.workouts)
-                tip = random.choice(FITNESS_TIPS[fitness_level])
-                st.info(f"💡 Tip for {fitness_level} level: {tip}")
+                try:
+                    save_workout(workout)
+                except Exception as e:
+                    st.error(f"Error saving workout: {str(e)}")
+                else:
+                    st.success("Workout logged successfully! 🎉")
+                    st.markdown(f"### {random.choice(MOTIVATIONAL_QUOTES)}")
+                    
+                    fitness_level = get_fitness_level(st.session_state.workouts_df)
+                    tip = random.choice(FITNESS_TIPS[fitness_level])
+                    st.info(f"💡 Tip for {fitness_level} level: {tip}")
                 
         with tabs[1]:
             st.info("Device sync feature coming soon!")
@@ -346,12 +473,14 @@ def main():
     elif page == "View Progress":
         st.header("📊 Your Progress")
         
-        if not st.session_state.workouts:
+        if st.session_state.workouts_df.empty:
             st.info("No workouts logged yet. Start by logging your first workout!")
             return
             
+        df = st.session_state.workouts_df
+        
         # Summary metrics
-        metrics = calculate_metrics(st.session_state.workouts)
+        metrics = calculate_metrics(df)
         col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
@@ -365,35 +494,18 @@ def main():
         with col5:
             st.metric("Avg Duration", f"{metrics['avg_duration']} mins")
             
-        # Progress charts
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(create_progress_chart(st.session_state.workouts, 'duration'), use_container_width=True)
-        with col2:
-            st.plotly_chart(create_workout_distribution(st.session_state.workouts), use_container_width=True)
-            
-        # Exercise tips
-        st.subheader("💡 Personalized Tips")
-        tips = generate_exercise_tips(st.session_state.workouts)
-        for tip in tips:
-            st.markdown(f"""
-                <div class="tip-box">
-                    <p style='color: #1a1a1a; margin: 0;'>💡 {tip}</p>
-                </div>
-            """, unsafe_allow_html=True)
-            
-        # Recent workouts
-        st.subheader("Recent Workouts")
-        df = pd.DataFrame(st.session_state.workouts[::-1])
-        st.dataframe(df, use_container_width=True)
+        _progress_section(st.session_state.workouts_key, df)
+        _tips_section(df)
+        _recent_section(st.session_state.workouts_key, df)
         
         st.markdown("### 💪 Your Fitness Journey")
-        fitness_level = get_fitness_level(st.session_state.workouts)
+        fitness_level = get_fitness_level(df)
+        daily_tip, daily_quote = get_daily_tip(fitness_level)
         st.markdown(f"""
             <div class="level-box">
                 <h4 style='color: #2E7D32; margin-bottom: 1rem;'>Current Level: {fitness_level}</h4>
-                <p style='color: #1a1a1a; margin-bottom: 1rem;'>Daily Tip: {random.choice(FITNESS_TIPS[fitness_level])}</p>
-                <p style='color: #4CAF50; font-style: italic; font-weight: bold;'>{random.choice(MOTIVATIONAL_QUOTES)}</p>
+                <p style='color: #1a1a1a; margin-bottom: 1rem;'>Daily Tip: {daily_tip}</p>
+                <p style='color: #4CAF50; font-style: italic; font-weight: bold;'>{daily_quote}</p>
             </div>
         """, unsafe_allow_html=True)
         
@@ -425,15 +537,16 @@ def main():
             
         # Display goals
         st.subheader("Your Goals")
-        for goal in st.session_state.goals:
-            st.markdown(f"""
+        if st.session_state.goals:
+            goals_html = "".join(f"""
                 <div class="goal-card">
                     <h4 style='color: #2E7D32; margin-bottom: 1rem;'>{goal['type']}</h4>
                     <p style='color: #1a1a1a;'>Target: {goal['target']}</p>
                     <p style='color: #1a1a1a;'>Current: {goal['current']}</p>
                     <p style='color: #666666;'>Added: {goal['date_added']}</p>
                 </div>
-            """, unsafe_allow_html=True)
+            """ for goal in st.session_state.goals)
+            st.markdown(goals_html, unsafe_allow_html=True)
         
     elif page == "Export Data":
         st.header("📤 Export Your Data")
@@ -444,10 +557,15 @@ def main():
         )
         
         if st.button("Export"):
-            df = pd.DataFrame(st.session_state.workouts)
+            workouts_key = st.session_state.workouts_key
+            df = st.session_state.workouts_df
             
             if export_format == "PDF":
-                pdf_data = create_pdf_report(st.session_state.workouts)
+                try:
+                    pdf_data = _pdf_bytes(workouts_key, df)
+                except Exception as e:
+                    st.error(f"Error creating PDF: {str(e)}")
+                    pdf_data = None
                 if pdf_data:
                     st.download_button(
                         "Download PDF",
@@ -457,18 +575,16 @@ def main():
                     )
                 
             elif export_format == "CSV":
-                csv = df.to_csv(index=False)
                 st.download_button(
                     "Download CSV",
-                    csv,
+                    _csv_bytes(workouts_key, df),
                     "fitness_tracker_data.csv",
                     "text/csv"
                 )
             else:  # TXT
-                txt = df.to_string()
                 st.download_button(
                     "Download TXT",
-                    txt,
+                    _txt_bytes(workouts_key, df),
                     "fitness_tracker_data.txt",
                     "text/plain"
                 )